@@ -1,20 +1,17 @@
 # app.py
 
 import streamlit as st
-import cv2
-import pandas as pd
 from datetime import datetime
-from streamlit_webrtc import webrtc_streamer, VideoTransformerBase, WebRtcMode
 import time
-import numpy as np
-import threading
-import av
 import warnings
 from zoneinfo import ZoneInfo
 from pathlib import Path
-from face_registration import save_face_data
-from take_attendance import load_model, mark_attendance
 from db import get_attendance_collection   # <-- NEW: for reading Mongo in app
+from resources import cascade_available, gallery_exists, get_model
+
+# Heavy modules are imported only where they are used: cv2, sklearn and
+# streamlit_webrtc once a camera section is started, pandas when there is
+# attendance data to show, pymongo when a database is configured.
 
 warnings.filterwarnings("ignore")
 
@@ -27,6 +24,8 @@ DEFAULT_ADMIN_PASSWORD = "admin123"  # this one is shown on the site
 # --- Initialize Session State ---
 if "start_registration" not in st.session_state:
     st.session_state.start_registration = False
+if "start_attendance" not in st.session_state:
+    st.session_state.start_attendance = False
 if "captured_faces" not in st.session_state:
     st.session_state.captured_faces = []
 if "new_name" not in st.session_state:
@@ -47,51 +46,6 @@ if "admin_password_current" not in st.session_state:
     st.session_state.admin_password_current = DEFAULT_ADMIN_PASSWORD
 
 
-# --- Load Models and Data ---
-try:
-    facedetect = cv2.CascadeClassifier('Data/haarcascade_frontalface_default.xml')
-except Exception as e:
-    st.error(f"Error loading Haar Cascade file: {e}. Make sure the file is in the 'Data' directory.")
-    st.stop()
-
-knn, error_message = load_model()
-if error_message:
-    st.warning(error_message)
-
-# --- Video Processor for Registration ---
-class RegistrationProcessor(VideoTransformerBase):
-    def __init__(self):
-        self.lock = threading.Lock()
-        self.last_capture_time = 0
-        self.frame_count = 0
-        self.local_captures = []
-
-    def recv(self, frame):
-        self.frame_count += 1
-        img = frame.to_ndarray(format="bgr24")
-
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        faces = facedetect.detectMultiScale(gray, 1.3, 5)
-
-        with self.lock:
-            current_time = time.time()
-            if len(faces) > 0:
-                st.session_state.feedback = "Face Detected!"
-                if current_time - self.last_capture_time > 1.0:
-                    if len(self.local_captures) < 5:
-                        (x, y, w, h) = faces[0]
-                        crop_img = img[y:y+h, x:x+w]
-                        if crop_img.size > 0:
-                            resized_img = cv2.resize(crop_img, (50, 50))
-                            self.local_captures.append(resized_img)
-                            self.last_capture_time = current_time
-                            print(f"*** CAPTURED IMAGE #{len(self.local_captures)} ***")
-            else:
-                st.session_state.feedback = "No Face Detected"
-
-        return av.VideoFrame.from_ndarray(img, format="bgr24")
-
-
 # ======================= Section 1: Register New Face =======================
 with st.container():
     st.subheader("Register New Face")
@@ -110,9 +64,15 @@ with st.container():
             st.rerun()
 
     if st.session_state.start_registration:
-        if len(st.session_state.captured_faces) < 5:
+        if not cascade_available():
+            st.error("Error loading Haar Cascade file. Make sure the file is in the 'Data' directory.")
+            st.session_state.start_registration = False
+        elif len(st.session_state.captured_faces) < 5:
             st.warning("Click the 'START' button below to turn on your camera.")
 
+            from streamlit_webrtc import webrtc_streamer, WebRtcMode
+            from video_processors import RegistrationProcessor
+
             ctx = webrtc_streamer(
                 key="registration",
                 mode=WebRtcMode.SENDRECV,
@@ -124,6 +84,7 @@ with st.container():
             if ctx.video_processor:
                 with ctx.video_processor.lock:
                     st.session_state.captured_faces = ctx.video_processor.local_captures.copy()
+                    st.session_state.feedback = ctx.video_processor.feedback
 
             if ctx.state.playing:
                 st.info("Please show your face to the camera. Capturing 5 images...")
@@ -140,10 +101,11 @@ with st.container():
             st.success("Capture complete! Saving your face data...")
             st.balloons()
 
+            from face_registration import save_face_data
             success, message = save_face_data(st.session_state.new_name, st.session_state.captured_faces)
             if success:
                 st.success(message)
-                st.info("Data saved. Please refresh the page to update the attendance model.")
+                st.info("Data saved. The attendance model will update automatically.")
             else:
                 st.error(message)
 
@@ -157,53 +119,36 @@ with st.container():
 with st.container():
     st.subheader("Take Attendance")
 
-    if knn:
-        st.info("Click 'START' below to begin attendance.")
-
-        class AttendanceProcessor(VideoTransformerBase):
-            def __init__(self):
-                # keep track of whose attendance has been marked in this session
-                self.attendance_register = set()
-
-            def recv(self, frame):
-                img = frame.to_ndarray(format="bgr24")
-                gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                faces = facedetect.detectMultiScale(gray, 1.3, 5)
-
-                recognized_name = ""
-
-                for (x, y, w, h) in faces:
-                    crop_img = img[y:y+h, x:x+w]
-                    if crop_img.size > 0:
-                        resized_img = cv2.resize(crop_img, (50, 50)).flatten().reshape(1, -1)
-                        output = knn.predict(resized_img)
-                        recognized_name = output[0]
-
-                        # draw box + label so you can SEE who it thinks you are
-                        cv2.rectangle(img, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                        cv2.putText(
-                            img, recognized_name, (x, y - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2
-                        )
-
-                # mark attendance ONCE per person for this run
-                if recognized_name and recognized_name not in self.attendance_register:
-                    self.attendance_register.add(recognized_name)
-                    message = mark_attendance(recognized_name)
-                    print(f"[ATTENDANCE] {message}")
+    if not gallery_exists():
+        st.info("Please register a face before taking attendance.")
+    elif not st.session_state.start_attendance:
+        if st.button("🎥 Start Attendance", key="start_att_btn"):
+            st.session_state.start_attendance = True
+            st.rerun()
+    elif not cascade_available():
+        st.error("Error loading Haar Cascade file. Make sure the file is in the 'Data' directory.")
+    else:
+        # trained once per process and reused until the face data changes
+        knn, error_message = get_model()
+        if error_message:
+            st.warning(error_message)
+        else:
+            st.info("Click 'START' below to begin attendance.")
 
-                return av.VideoFrame.from_ndarray(img, format="bgr24")
+            from streamlit_webrtc import webrtc_streamer, WebRtcMode
+            from video_processors import AttendanceProcessor
 
-        webrtc_streamer(
-            key="attendance",
-            mode=WebRtcMode.SENDRECV,
-            video_processor_factory=AttendanceProcessor,
-            media_stream_constraints={"video": True, "audio": False},
-            async_processing=False,
-        )
+            webrtc_streamer(
+                key="attendance",
+                mode=WebRtcMode.SENDRECV,
+                video_processor_factory=lambda: AttendanceProcessor(knn),
+                media_stream_constraints={"video": True, "audio": False},
+                async_processing=False,
+            )
 
-    else:
-        st.info("Please register a face before taking attendance.")
+        if st.button("Stop Attendance", key="stop_att_btn"):
+            st.session_state.start_attendance = False
+            st.rerun()
 
 
 # ======================= Section 3: Today's Attendance (from MongoDB) =======================
@@ -218,6 +163,7 @@ with st.container():
     else:
         docs = list(collection.find({"date": today_str}))
         if docs:
+            import pandas as pd
             df_today = pd.DataFrame(docs)
             if "_id" in df_today.columns:
                 df_today.drop(columns=["_id"], inplace=True)
@@ -247,6 +193,7 @@ with st.container():
         docs = list(collection.find({"date": selected_date_str}))
 
         if docs:
+            import pandas as pd
             df_sel = pd.DataFrame(docs)
             if "_id" in df_sel.columns:
                 df_sel.drop(columns=["_id"], inplace=True)
@@ -332,6 +279,7 @@ with st.container():
             if collection is None:
                 st.info("Cloud database is not configured.")
             else:
+                import pandas as pd
                 docs = list(collection.find({"date": edit_date_str}))
                 if docs:
                     df_edit = pd.DataFrame(docs)
@@ -398,6 +346,7 @@ with st.container():
                 if not docs:
                     st.info("No attendance data found yet.")
                 else:
+                    import pandas as pd
                     df_all = pd.DataFrame(docs)
                     if "_id" in df_all.columns:
                         df_all.drop(columns=["_id"], inplace=True)
@@ -446,6 +395,7 @@ with st.container():
                 if not docs:
                     st.info("No attendance data found yet for comparison.")
                 else:
+                    import pandas as pd
                     df_all_cmp = pd.DataFrame(docs)
                     if "_id" in df_all_cmp.columns:
                         df_all_cmp.drop(columns=["_id"], inplace=True)
@@ -0,0 +1,171 @@
+# bulk_enroll.py
+#
+# Enrolls many people at once from a folder of photos instead of the webcam:
+#
+#   photos/
+#     Alice/  img1.jpg img2.jpg ...
+#     Bob/    img1.jpg ...
+#
+# Usage:
+#   python bulk_enroll.py photos/ --workers 8
+
+import argparse
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import cv2
+
+from face_registration import save_faces_batch
+from resources import CASCADE_PATH
+
+warnings.filterwarnings("ignore")
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+# one cascade per worker process, created by _init_worker
+facedetect = None
+
+
+def _init_worker(cascade_path):
+    global facedetect
+    facedetect = cv2.CascadeClassifier(cascade_path)
+
+
+def find_images(root):
+    """
+    Returns a list of (name, image_path) pairs, one folder per person.
+    """
+    jobs = []
+    for person_dir in sorted(Path(root).iterdir()):
+        if not person_dir.is_dir():
+            continue
+        for img_path in sorted(person_dir.rglob("*")):
+            if img_path.suffix.lower() in IMAGE_EXTENSIONS:
+                jobs.append((person_dir.name, str(img_path)))
+    return jobs
+
+
+def extract_face(job):
+    """
+    Detects and crops the face in one image, the same way RegistrationProcessor does.
+    Returns (name, image_path, face_or_None, reject_reason_or_None).
+    """
+    name, img_path = job
+    img = cv2.imread(img_path)
+    if img is None:
+        return name, img_path, None, "unreadable image"
+
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    faces = facedetect.detectMultiScale(gray, 1.3, 5)
+
+    if len(faces) == 0:
+        return name, img_path, None, "no face"
+    if len(faces) > 1:
+        return name, img_path, None, f"{len(faces)} faces"
+
+    (x, y, w, h) = faces[0]
+    crop_img = img[y:y+h, x:x+w]
+    if crop_img.size == 0:
+        return name, img_path, None, "empty crop"
+
+    return name, img_path, cv2.resize(crop_img, (50, 50)), None
+
+
+def bulk_enroll(root, workers=None, dry_run=False):
+    """
+    Extracts faces from every image under `root` across a process pool and
+    appends all of them to the gallery in one save_faces_batch call.
+    Returns a dict with the report.
+    """
+    jobs = find_images(root)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    start = time.perf_counter()
+
+    names, faces, rejected = [], [], []
+    per_person = {}
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(CASCADE_PATH,)) as pool:
+        for name, img_path, face, reason in pool.map(extract_face, jobs, chunksize=chunksize):
+            per_person.setdefault(name, 0)
+            if face is None:
+                rejected.append((img_path, reason))
+                continue
+            names.append(name)
+            faces.append(face)
+            per_person[name] += 1
+
+    elapsed = time.perf_counter() - start
+
+    if dry_run:
+        success, message = True, "Dry run: nothing was saved."
+    elif faces:
+        success, message = save_faces_batch(names, faces)
+    else:
+        success, message = False, "No usable faces were found."
+
+    return {
+        "images": len(jobs),
+        "accepted": len(faces),
+        "rejected": rejected,
+        "per_person": per_person,
+        "elapsed": elapsed,
+        "workers": workers,
+        "success": success,
+        "message": message,
+    }
+
+
+def print_report(report):
+    images = report["images"]
+    elapsed = report["elapsed"]
+    rate = images / elapsed if elapsed > 0 else 0.0
+
+    print("\n===== Bulk Enrollment Report =====")
+    print(f"People found:     {len(report['per_person'])}")
+    print(f"Images processed: {images}")
+    print(f"Faces accepted:   {report['accepted']}")
+    print(f"Images rejected:  {len(report['rejected'])}")
+    print(f"Workers:          {report['workers']}")
+    print(f"Extraction time:  {elapsed:.2f}s ({rate:.1f} images/s)")
+
+    empty = [name for name, count in report["per_person"].items() if count == 0]
+    if empty:
+        print("\nPeople with no usable images (not enrolled):")
+        for name in empty:
+            print(f"  - {name}")
+
+    if report["rejected"]:
+        print("\nRejected images:")
+        for img_path, reason in report["rejected"]:
+            print(f"  - {img_path}: {reason}")
+
+    print(f"\n{report['message']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enroll faces in bulk from a folder of photos (one sub-folder per person).")
+    parser.add_argument("root", help="Folder containing one sub-folder of photos per person")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Detect and report only, do not save to Data/")
+    args = parser.parse_args()
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not Path(args.root).is_dir():
+        parser.error(f"{args.root} is not a directory")
+    if not Path(CASCADE_PATH).exists():
+        parser.error(f"Haar Cascade file not found at {CASCADE_PATH}")
+
+    report = bulk_enroll(args.root, workers=args.workers, dry_run=args.dry_run)
+    print_report(report)
+    return 0 if report["success"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
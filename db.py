@@ -1,12 +1,20 @@
 # db.py
 
-from pymongo import MongoClient
 import streamlit as st
 
+
+@st.cache_resource(show_spinner=False)
+def _create_mongo_client(uri):
+    # one client (and connection pool) per process, shared by all sessions
+    from pymongo import MongoClient
+    return MongoClient(uri)
+
+
 def get_mongo_client():
     """
     Returns a MongoClient instance if MONGO_URI is configured in Streamlit secrets.
     Otherwise returns None so the app can still run without cloud DB.
+    The client is created on first use and reused afterwards.
     """
     uri = None
 
@@ -22,7 +30,7 @@ def get_mongo_client():
         return None
 
     try:
-        client = MongoClient(uri)
+        client = _create_mongo_client(uri)
         return client
     except Exception as e:
         print(f"[Cloud DB] Failed to create MongoClient: {e}")
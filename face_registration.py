@@ -11,9 +11,23 @@ def save_face_data(name, faces_to_save):
     """
     Saves the captured face data and corresponding names to pickle files.
     """
+    if not name or not faces_to_save:
+        return False, "Name or face data is missing."
+
+    return save_faces_batch([name] * len(faces_to_save), faces_to_save)
+
+
+def save_faces_batch(names_to_save, faces_to_save):
+    """
+    Appends many labelled faces to the pickle files in a single read/write.
+    `names_to_save[i]` is the label for `faces_to_save[i]`, so several people
+    can be enrolled at once (used by bulk_enroll.py).
+    """
     try:
-        if not name or not faces_to_save:
+        if not names_to_save or not faces_to_save:
             return False, "Name or face data is missing."
+        if len(names_to_save) != len(faces_to_save):
+            return False, f"Got {len(names_to_save)} names for {len(faces_to_save)} faces; there must be one name per face."
 
         faces_data = np.asarray(faces_to_save)
         faces_data = faces_data.reshape(len(faces_to_save), -1)
@@ -28,7 +42,7 @@ def save_face_data(name, faces_to_save):
         except (FileNotFoundError, EOFError):
             names = []
         
-        names.extend([name] * len(faces_to_save))
+        names.extend(names_to_save)
         with open('Data/names.pkl', 'wb') as f:
             pickle.dump(names, f)
 
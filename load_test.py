@@ -0,0 +1,397 @@
+# load_test.py
+#
+# Headless load test for the video processors. Builds RegistrationProcessor /
+# AttendanceProcessor directly (no browser, no webrtc_streamer) and feeds them
+# av.VideoFrames at a target fps on N concurrent streams, one thread per
+# stream like streamlit-webrtc does.
+#
+# Usage:
+#   python load_test.py --streams 8 --fps 15 --duration 30
+#   python load_test.py --streams 4 --video sample.mp4 --processor registration
+#   python load_test.py --streams 4 --mongo-uri mongodb://localhost:27017
+
+import argparse
+import json
+import os
+import pickle
+import threading
+import time
+import warnings
+
+import av
+import cv2
+import numpy as np
+
+from resources import CASCADE_PATH
+from take_attendance import load_model, mark_attendance
+from video_processors import RegistrationProcessor, AttendanceProcessor
+
+warnings.filterwarnings("ignore")
+
+
+class InMemoryCollection:
+    """
+    Minimal thread-safe stand-in for the MongoDB collection used by
+    mark_attendance (only find_one / insert_one / find / drop are needed).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.docs = []
+
+    def _matches(self, doc, query):
+        return all(doc.get(k) == v for k, v in query.items())
+
+    def find_one(self, query):
+        with self.lock:
+            for doc in self.docs:
+                if self._matches(doc, query):
+                    return dict(doc)
+        return None
+
+    def find(self, query=None):
+        query = query or {}
+        with self.lock:
+            return [dict(doc) for doc in self.docs if self._matches(doc, query)]
+
+    def insert_one(self, doc):
+        with self.lock:
+            self.docs.append(dict(doc))
+
+    def drop(self):
+        with self.lock:
+            self.docs = []
+
+
+class CountingCollection:
+    """
+    One stream's view of the shared collection. Counts the records this
+    stream actually writes, as opposed to lookups that find the person
+    already marked for today.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.writes = 0
+
+    def find_one(self, query):
+        return self.collection.find_one(query)
+
+    def insert_one(self, doc):
+        result = self.collection.insert_one(doc)
+        self.writes += 1
+        return result
+
+
+class CountingDetector:
+    """
+    Wraps one stream's own CascadeClassifier (cascades are not thread-safe,
+    so streams never share one) and counts the faces it finds.
+    """
+
+    def __init__(self, cascade_path):
+        self.cascade = cv2.CascadeClassifier(cascade_path)
+        self.faces = 0
+
+    def detectMultiScale(self, *args, **kwargs):
+        faces = self.cascade.detectMultiScale(*args, **kwargs)
+        self.faces += len(faces)
+        return faces
+
+
+def get_collection(mongo_uri):
+    """
+    Returns a real collection on a local MongoDB if a URI is given,
+    otherwise an in-memory stand-in. The MongoDB collection is new for every
+    run, so records left by an earlier run never turn writes into lookups.
+    """
+    if not mongo_uri:
+        return InMemoryCollection()
+
+    from pymongo import MongoClient
+    client = MongoClient(mongo_uri)
+    col_name = f"attendance_records_{int(time.time())}_{os.getpid()}"
+    return client["smart_attendance_loadtest"][col_name]
+
+
+def decode_video(path, width, height, max_frames):
+    """
+    Decodes up to `max_frames` frames of a video file into av.VideoFrames.
+    """
+    frames = []
+    with av.open(path) as container:
+        for frame in container.decode(video=0):
+            frames.append(frame.reformat(width=width, height=height, format="bgr24"))
+            if len(frames) >= max_frames:
+                break
+    return frames
+
+
+def synthesize_frames(width, height, count, seed=0):
+    """
+    Builds noisy frames with a registered face (from Data/faces_data.pkl)
+    pasted in, so detection and recognition both get exercised.
+    """
+    rng = np.random.default_rng(seed)
+
+    gallery = None
+    try:
+        with open('Data/faces_data.pkl', 'rb') as f:
+            gallery = pickle.load(f).reshape(-1, 50, 50, 3).astype(np.uint8)
+    except (FileNotFoundError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    size = min(width, height) // 2
+    frames = []
+    for i in range(count):
+        img = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        img = cv2.GaussianBlur(img, (9, 9), 0)
+        if gallery is not None and len(gallery) > 0:
+            face = cv2.resize(gallery[i % len(gallery)], (size, size))
+            # drift the face a little between frames
+            x = (width - size) // 2 + int(10 * np.sin(i / 5))
+            y = (height - size) // 2
+            img[y:y+size, x:x+size] = face
+        frames.append(av.VideoFrame.from_ndarray(img, format="bgr24"))
+    return frames
+
+
+def run_stream(processor, frames, fps, duration, result):
+    """
+    Feeds `frames` (looped) to `processor.recv` at `fps` for `duration` seconds.
+    A frame that is already older than one frame interval when the processor
+    is free is counted as dropped, like a live camera source would drop it.
+    Any exception is stored in result["error"] with the stats gathered so far.
+    """
+    interval = 1.0 / fps
+    total_frames = int(duration * fps)
+    latencies = []
+    dropped = 0
+    processed = 0
+
+    error = None
+    cpu_start = time.thread_time()
+    t0 = time.perf_counter()
+    next_idx = 0
+
+    try:
+        while next_idx < total_frames:
+            now = time.perf_counter()
+            due_idx = int((now - t0) / interval)
+            if due_idx > next_idx:
+                # skip to the newest frame the camera has produced
+                skipped = min(due_idx, total_frames) - next_idx
+                dropped += skipped
+                next_idx += skipped
+                if next_idx >= total_frames:
+                    break
+
+            due_time = t0 + next_idx * interval
+            if due_time > now:
+                time.sleep(due_time - now)
+
+            processor.recv(frames[next_idx % len(frames)])
+            latencies.append(time.perf_counter() - due_time)
+            processed += 1
+            next_idx += 1
+    except Exception as e:
+        # report the stream as failed instead of killing the whole run
+        error = f"{type(e).__name__}: {e}"
+
+    wall = time.perf_counter() - t0
+    cpu = time.thread_time() - cpu_start
+
+    result.update({
+        "processed": processed,
+        "dropped": dropped,
+        "wall": wall,
+        "cpu": cpu,
+        "latencies": latencies,
+        "error": error,
+    })
+
+
+def summarize(results, target_fps, process_cpu, wall, counts_marks):
+    """
+    Turns raw per-stream results into the numbers printed in the report.
+    Streams that raised are listed with their error and left out of the totals.
+    `process_cpu` is the CPU time of the whole process during the run; it also
+    covers OpenCV's own worker threads, which thread_time() does not see.
+    """
+    rows = []
+    for i, r in enumerate(results):
+        lat_ms = np.asarray(r["latencies"]) * 1000 if r["latencies"] else np.zeros(1)
+        rows.append({
+            "stream": i,
+            "achieved_fps": r["processed"] / r["wall"] if r["wall"] > 0 else 0.0,
+            "p50_ms": float(np.percentile(lat_ms, 50)),
+            "p90_ms": float(np.percentile(lat_ms, 90)),
+            "p99_ms": float(np.percentile(lat_ms, 99)),
+            "processed": r["processed"],
+            "dropped": r["dropped"],
+            "faces": r["faces"],
+            "lookups": r["lookups"],
+            "writes": r["writes"],
+            "thread_cpu_pct": 100.0 * r["cpu"] / r["wall"] if r["wall"] > 0 else 0.0,
+            "error": r["error"],
+        })
+
+    ok = [row for row, r in zip(rows, results) if r["error"] is None]
+    ok_results = [r for r in results if r["error"] is None]
+    all_lat = np.concatenate([np.asarray(r["latencies"]) for r in ok_results if r["latencies"]] or [np.zeros(1)]) * 1000
+    processed = sum(r["processed"] for r in ok_results)
+    dropped = sum(r["dropped"] for r in ok_results)
+    total = {
+        "streams": len(results),
+        "failed_streams": len(results) - len(ok),
+        "target_fps": target_fps,
+        "mean_fps_per_stream": float(np.mean([row["achieved_fps"] for row in ok])) if ok else 0.0,
+        "p50_ms": float(np.percentile(all_lat, 50)),
+        "p90_ms": float(np.percentile(all_lat, 90)),
+        "p99_ms": float(np.percentile(all_lat, 99)),
+        "processed": processed,
+        "dropped": dropped,
+        "drop_rate": dropped / (processed + dropped) if processed + dropped else 0.0,
+        "faces": sum(row["faces"] for row in ok),
+        "lookups": sum(row["lookups"] for row in ok) if counts_marks else None,
+        "writes": sum(row["writes"] for row in ok) if counts_marks else None,
+        "cpu_pct_per_stream": 100.0 * process_cpu / wall / len(results) if wall > 0 else 0.0,
+        "thread_cpu_pct_per_stream": float(np.mean([row["thread_cpu_pct"] for row in ok])) if ok else 0.0,
+        "cv2_threads": cv2.getNumThreads(),
+    }
+    return rows, total
+
+
+def print_report(rows, total):
+    print("\n===== Load Test Report =====")
+    print(f"{'stream':>6} {'fps':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'frames':>7} {'dropped':>8} "
+          f"{'faces':>7} {'lookups':>8} {'writes':>7} {'thr cpu %':>10}")
+    for row in rows:
+        lookups = row["lookups"] if total["lookups"] is not None else "-"
+        writes = row["writes"] if total["writes"] is not None else "-"
+        print(f"{row['stream']:>6} {row['achieved_fps']:>7.1f} {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+              f"{row['p99_ms']:>8.1f} {row['processed']:>7} {row['dropped']:>8} "
+              f"{row['faces']:>7} {lookups:>8} {writes:>7} {row['thread_cpu_pct']:>10.1f}")
+        if row["error"]:
+            print(f"{'':>6} FAILED: {row['error']}")
+
+    print(f"\nStreams:               {total['streams']} @ {total['target_fps']} fps target"
+          f" ({total['failed_streams']} failed)")
+    print(f"Mean fps per stream:   {total['mean_fps_per_stream']:.1f}")
+    print(f"Latency p50/p90/p99:   {total['p50_ms']:.1f} / {total['p90_ms']:.1f} / {total['p99_ms']:.1f} ms")
+    print(f"Frames processed:      {total['processed']}")
+    print(f"Frames dropped:        {total['dropped']} ({total['drop_rate'] * 100:.1f}%)")
+    print(f"Faces detected:        {total['faces']}")
+    if total["writes"] is not None:
+        print(f"Attendance lookups:    {total['lookups']} (mark_attendance calls)")
+        print(f"Attendances written:   {total['writes']} (new records)")
+    print(f"CPU per stream:        {total['cpu_pct_per_stream']:.1f}% of one core "
+          f"(whole process / streams; stream thread alone: {total['thread_cpu_pct_per_stream']:.1f}%)")
+    print(f"OpenCV threads:        {total['cv2_threads']}")
+
+    if total["failed_streams"]:
+        print(f"\nWARNING: {total['failed_streams']} stream(s) failed; their numbers are excluded from the totals.")
+    no_faces = [row["stream"] for row in rows if row["faces"] == 0]
+    if no_faces:
+        print(f"WARNING: no faces detected on stream(s) {no_faces}; recognition was not exercised, "
+              "so fps is optimistic. Use --video with real faces.")
+    if total["writes"] is not None:
+        no_lookups = [row["stream"] for row in rows if row["lookups"] == 0]
+        if no_lookups:
+            print(f"WARNING: no one was recognized on stream(s) {no_lookups}; mark_attendance was never called there.")
+        if total["writes"] == 0:
+            print("WARNING: no attendance records were written; the database write path was not exercised.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay frames through the video processors on N concurrent streams.")
+    parser.add_argument("--streams", type=int, default=4, help="Number of concurrent streams")
+    parser.add_argument("--fps", type=float, default=15.0, help="Target frames per second per stream")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run each stream")
+    parser.add_argument("--processor", choices=["attendance", "registration"], default="attendance")
+    parser.add_argument("--video", action="append", default=[], help="Sample video to replay (repeat for several; streams cycle through them)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--max-frames", type=int, default=300, help="Frames kept in memory per video (replayed in a loop)")
+    parser.add_argument("--mongo-uri", default=None, help="Local MongoDB to write attendance to (default: in-memory stand-in)")
+    parser.add_argument("--json", default=None, help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    if args.streams < 1 or args.fps <= 0 or args.duration <= 0:
+        parser.error("--streams, --fps and --duration must be positive")
+
+    if cv2.CascadeClassifier(CASCADE_PATH).empty():
+        parser.error(f"Could not load Haar Cascade file at {CASCADE_PATH}")
+
+    if args.video:
+        sources = [decode_video(path, args.width, args.height, args.max_frames) for path in args.video]
+        for path, frames in zip(args.video, sources):
+            if not frames:
+                parser.error(f"No frames could be decoded from {path}")
+    else:
+        sources = [synthesize_frames(args.width, args.height, min(args.max_frames, 60))]
+
+    counts_marks = args.processor == "attendance"
+    if counts_marks:
+        knn, error_message = load_model()
+        if error_message:
+            parser.error(error_message)
+        collection = get_collection(args.mongo_uri)
+
+    results = [{} for _ in range(args.streams)]
+
+    def make_processor(result):
+        # every stream gets its own cascade, as every app session does
+        detector = CountingDetector(CASCADE_PATH)
+        result["detector"] = detector
+        result["lookups"] = 0
+        if not counts_marks:
+            return RegistrationProcessor(facedetect=detector)
+
+        stream_collection = CountingCollection(collection)
+        result["collection"] = stream_collection
+
+        def mark_fn(name):
+            result["lookups"] += 1
+            return mark_attendance(name, collection=stream_collection)
+
+        return AttendanceProcessor(knn, facedetect=detector, mark_fn=mark_fn)
+
+    threads = [
+        threading.Thread(
+            target=run_stream,
+            args=(make_processor(results[i]), sources[i % len(sources)], args.fps, args.duration, results[i]),
+            daemon=True,
+        )
+        for i in range(args.streams)
+    ]
+
+    print(f"Running {args.streams} {args.processor} stream(s) at {args.fps} fps for {args.duration}s...")
+    cpu_start = time.process_time()
+    t0 = time.perf_counter()
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        if counts_marks:
+            collection.drop()
+    wall = time.perf_counter() - t0
+    process_cpu = time.process_time() - cpu_start
+
+    for r in results:
+        r["faces"] = r.pop("detector").faces
+        stream_collection = r.pop("collection", None)
+        r["writes"] = stream_collection.writes if stream_collection else 0
+
+    rows, total = summarize(results, args.fps, process_cpu, wall, counts_marks)
+    print_report(rows, total)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"streams": rows, "total": total}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
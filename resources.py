@@ -0,0 +1,49 @@
+# resources.py
+#
+# Cheap checks and process-wide resources for app.py. Nothing heavy is
+# imported here; the KNN model is trained on first use and then shared by
+# every session and rerun (st.cache_resource).
+#
+# The Haar cascade is deliberately NOT shared: CascadeClassifier is not
+# thread-safe, so each video processor builds its own (video_processors.py).
+
+import os
+
+import streamlit as st
+
+CASCADE_PATH = 'Data/haarcascade_frontalface_default.xml'
+GALLERY_FILES = ('Data/names.pkl', 'Data/faces_data.pkl')
+
+
+def cascade_available():
+    """
+    Returns True if the Haar Cascade file is present (without parsing it).
+    """
+    return os.path.exists(CASCADE_PATH)
+
+
+def gallery_exists():
+    """
+    Returns True if face data has been saved, without loading or training anything.
+    """
+    return all(os.path.exists(p) for p in GALLERY_FILES)
+
+
+def _gallery_version():
+    # modification times of the face data files; changes whenever faces are
+    # saved (webcam or bulk_enroll.py) or erased
+    return tuple(os.path.getmtime(p) if os.path.exists(p) else None for p in GALLERY_FILES)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_model_cached(version):
+    from take_attendance import load_model
+    return load_model()
+
+
+def get_model():
+    """
+    Returns (knn, error_message) like take_attendance.load_model, but only
+    retrains when the face data files have changed.
+    """
+    return _load_model_cached(_gallery_version())
@@ -0,0 +1,127 @@
+# startup_report.py
+#
+# Measures how long app.py takes to render for the first time in a fresh
+# process, and how long each rerun takes after that. Uses Streamlit's
+# headless AppTest runner, so no browser or server is needed.
+#
+# Usage:
+#   python startup_report.py                    # current tree only
+#   python startup_report.py --compare HEAD~1   # before (git revision) vs after
+
+import argparse
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+HEAVY_MODULES = ["cv2", "sklearn", "pandas", "pymongo", "streamlit_webrtc"]
+
+# Runs inside a fresh interpreter in the app's directory and prints one JSON line.
+CHILD_SCRIPT = """
+import json, os, statistics, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+t_import = time.perf_counter() - t0
+
+at = AppTest.from_file(os.path.abspath("app.py"), default_timeout=120)
+at.run()
+t_first = time.perf_counter() - t0
+loaded = [m for m in {heavy!r} if m in sys.modules]
+
+reruns = []
+for _ in range({reruns}):
+    t = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - t)
+
+print(json.dumps({{
+    "streamlit_import_s": t_import,
+    "first_render_s": t_first,
+    "rerun_mean_s": statistics.mean(reruns) if reruns else 0.0,
+    "rerun_p90_s": sorted(reruns)[int(0.9 * (len(reruns) - 1))] if reruns else 0.0,
+    "heavy_modules_loaded": loaded,
+    "exceptions": [str(e.value) for e in at.exception],
+}}))
+"""
+
+
+def export_revision(rev, dest):
+    """
+    Writes the files of git revision `rev` into `dest` (like a clean checkout).
+    """
+    archive = subprocess.run(["git", "archive", "--format=tar", rev], cwd=APP_DIR,
+                             check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest, filter="data")
+        else:
+            # Python without extraction filters (before 3.8.17 / 3.11.4)
+            tar.extractall(dest)
+
+
+def measure(app_dir, reruns, samples):
+    """
+    Runs the child script `samples` times (each in a new process) and keeps
+    the fastest first render, which is the least disturbed by other load.
+    """
+    code = CHILD_SCRIPT.format(heavy=HEAVY_MODULES, reruns=reruns)
+    best = None
+    for _ in range(samples):
+        proc = subprocess.run([sys.executable, "-c", code], cwd=app_dir, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"App run failed in {app_dir}:\n{proc.stderr}")
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or result["first_render_s"] < best["first_render_s"]:
+            best = result
+    return best
+
+
+def print_report(results):
+    labels = list(results)
+    print("\n===== Startup Report =====")
+    width = max(16, *(len(label) + 2 for label in labels))
+    print(f"{'':28}" + "".join(f"{label:>{width}}" for label in labels))
+    for key, title in [
+        ("streamlit_import_s", "import streamlit (s)"),
+        ("first_render_s", "time to first render (s)"),
+        ("rerun_mean_s", "rerun mean (s)"),
+        ("rerun_p90_s", "rerun p90 (s)"),
+    ]:
+        print(f"{title:28}" + "".join(f"{results[label][key]:>{width}.3f}" for label in labels))
+
+    for label in labels:
+        loaded = ", ".join(results[label]["heavy_modules_loaded"]) or "none"
+        print(f"\n[{label}] heavy modules loaded by first render: {loaded}")
+        for err in results[label]["exceptions"]:
+            print(f"[{label}] app raised: {err}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report app.py time to first render and per-rerun overhead.")
+    parser.add_argument("--compare", metavar="REV", default=None, help="Git revision to measure as 'before'")
+    parser.add_argument("--reruns", type=int, default=10, help="Reruns to time after the first render")
+    parser.add_argument("--samples", type=int, default=3, help="Fresh processes to start per measurement")
+    parser.add_argument("--json", default=None, help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    if args.compare:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_revision(args.compare, tmp)
+            results[f"before ({args.compare})"] = measure(tmp, args.reruns, args.samples)
+    results["after (working tree)" if args.compare else "current"] = measure(APP_DIR, args.reruns, args.samples)
+
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
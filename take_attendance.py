@@ -2,7 +2,6 @@
 
 import pickle
 from datetime import datetime
-from sklearn.neighbors import KNeighborsClassifier
 from pathlib import Path
 import warnings
 from zoneinfo import ZoneInfo
@@ -17,6 +16,9 @@ def load_model():
     Loads face data and trains a KNN classifier.
     Returns a tuple: (classifier, error_message).
     """
+    # imported here so importing mark_attendance does not pull in sklearn
+    from sklearn.neighbors import KNeighborsClassifier
+
     try:
         with open('Data/names.pkl', 'rb') as w:
             LABELS = pickle.load(w)
@@ -30,12 +32,13 @@ def load_model():
         return None, f"Error loading model data: {e}. Please register a face first."
 
 
-def mark_attendance(name):
+def mark_attendance(name, collection=None):
     """
     Marks attendance for a given name by saving it to MongoDB.
 
     - One record per person per day.
     - Uses Asia/Kolkata timezone.
+    - `collection` overrides the configured cloud collection (used by load_test.py).
     """
     try:
         print("Entered mark_attendance")
@@ -44,7 +47,8 @@ def mark_attendance(name):
         date_str = ts.strftime("%d-%m-%Y")
         time_str = ts.strftime("%H:%M:%S")
 
-        collection = get_attendance_collection()
+        if collection is None:
+            collection = get_attendance_collection()
         if collection is None:
             # Hard stop because you explicitly want cloud DB as source of truth
             return "Cloud database is not configured. Please set MONGO_* in secrets."
@@ -0,0 +1,101 @@
+# video_processors.py
+#
+# Video processors used by webrtc_streamer in app.py. They are kept out of
+# app.py so they can also be driven without a browser (see load_test.py).
+# Each processor owns its face detector unless one is passed in.
+
+import threading
+import time
+
+import av
+import cv2
+from streamlit_webrtc import VideoTransformerBase
+
+from resources import CASCADE_PATH
+from take_attendance import mark_attendance
+
+
+def new_face_detector():
+    """
+    Parses a fresh Haar Cascade. CascadeClassifier is not thread-safe, so
+    every stream (one thread each) must use its own instead of sharing one.
+    """
+    facedetect = cv2.CascadeClassifier(CASCADE_PATH)
+    if facedetect.empty():
+        raise FileNotFoundError(f"Could not load {CASCADE_PATH}")
+    return facedetect
+
+
+# --- Video Processor for Registration ---
+class RegistrationProcessor(VideoTransformerBase):
+    def __init__(self, facedetect=None):
+        self.facedetect = facedetect if facedetect is not None else new_face_detector()
+        self.lock = threading.Lock()
+        self.last_capture_time = 0
+        self.frame_count = 0
+        self.local_captures = []
+        self.feedback = "Initializing..."
+
+    def recv(self, frame):
+        self.frame_count += 1
+        img = frame.to_ndarray(format="bgr24")
+
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        faces = self.facedetect.detectMultiScale(gray, 1.3, 5)
+
+        with self.lock:
+            current_time = time.time()
+            if len(faces) > 0:
+                self.feedback = "Face Detected!"
+                if current_time - self.last_capture_time > 1.0:
+                    if len(self.local_captures) < 5:
+                        (x, y, w, h) = faces[0]
+                        crop_img = img[y:y+h, x:x+w]
+                        if crop_img.size > 0:
+                            resized_img = cv2.resize(crop_img, (50, 50))
+                            self.local_captures.append(resized_img)
+                            self.last_capture_time = current_time
+                            print(f"*** CAPTURED IMAGE #{len(self.local_captures)} ***")
+            else:
+                self.feedback = "No Face Detected"
+
+        return av.VideoFrame.from_ndarray(img, format="bgr24")
+
+
+# --- Video Processor for Attendance ---
+class AttendanceProcessor(VideoTransformerBase):
+    def __init__(self, knn, facedetect=None, mark_fn=mark_attendance):
+        self.facedetect = facedetect if facedetect is not None else new_face_detector()
+        self.knn = knn
+        self.mark_fn = mark_fn
+        # keep track of whose attendance has been marked in this session
+        self.attendance_register = set()
+
+    def recv(self, frame):
+        img = frame.to_ndarray(format="bgr24")
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        faces = self.facedetect.detectMultiScale(gray, 1.3, 5)
+
+        recognized_name = ""
+
+        for (x, y, w, h) in faces:
+            crop_img = img[y:y+h, x:x+w]
+            if crop_img.size > 0:
+                resized_img = cv2.resize(crop_img, (50, 50)).flatten().reshape(1, -1)
+                output = self.knn.predict(resized_img)
+                recognized_name = output[0]
+
+                # draw box + label so you can SEE who it thinks you are
+                cv2.rectangle(img, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                cv2.putText(
+                    img, recognized_name, (x, y - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2
+                )
+
+        # mark attendance ONCE per person for this run
+        if recognized_name and recognized_name not in self.attendance_register:
+            self.attendance_register.add(recognized_name)
+            message = self.mark_fn(recognized_name)
+            print(f"[ATTENDANCE] {message}")
+
+        return av.VideoFrame.from_ndarray(img, format="bgr24")